@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# reagent_engine.py（エンジン）と app.py（Streamlit画面）はリポジトリ直下のモジュール
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,104 @@
+"""バッチモードのチェックポイント・再開の検証
+
+StagedPipelineは偽物に差し替え、製品×サイトごとの結果をon_resultへ渡すだけにする
+（SERP・Browser・Geminiには接続しない）。
+"""
+import csv
+import json
+
+import pytest
+
+import reagent_engine
+
+SITES = {key: reagent_engine.TARGET_SITES[key] for key in ('mce', 'tci')}
+
+
+def make_product(product_name, site_key):
+    return {
+        'productName': product_name,
+        'source_site': site_key,
+        'source_url': f'https://example.com/{site_key}/{product_name}',
+        'modelNumber': 'X-1',
+        'manufacturer': site_key,
+        'offers': [{'size': '1mg', 'price': 14800, 'inStock': True}],
+    }
+
+
+class FakePipeline:
+    """run()に渡された製品名を記録し、全サイトの結果を順に返す"""
+    runs = []
+
+    def __init__(self, serp_config, model, logger, stage_workers=None, on_result=None, browser_manager=None):
+        self.on_result = on_result
+
+    def run(self, product_names, sites):
+        FakePipeline.runs.append(list(product_names))
+        for product_name in product_names:
+            for site_key in sites:
+                self.on_result({'product_name': product_name, 'site_key': site_key},
+                               make_product(product_name, site_key), False)
+
+    def metrics(self):
+        return []
+
+
+@pytest.fixture
+def batch_env(monkeypatch):
+    FakePipeline.runs = []
+    monkeypatch.setattr(reagent_engine, 'StagedPipeline', FakePipeline)
+    monkeypatch.setattr(reagent_engine, 'check_serp_api_config', lambda: {'available': True})
+    monkeypatch.setattr(reagent_engine, 'setup_gemini', lambda logger=None: object())
+    monkeypatch.setattr(reagent_engine, 'get_browser_manager', lambda pool_size=None: None)
+    monkeypatch.setattr(reagent_engine, 'TARGET_SITES', SITES)
+    return FakePipeline
+
+
+def read_csv_names(path):
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        return [row['検索語'] for row in csv.DictReader(f)]
+
+
+def test_writer_waits_for_every_site(tmp_path):
+    output_path = tmp_path / 'out.csv'
+    checkpoint_path = tmp_path / 'out.csv.checkpoint.jsonl'
+    writer = reagent_engine.BatchResultWriter(str(output_path), str(checkpoint_path), 2, reagent_engine.ConsoleLogger())
+
+    writer.on_result({'product_name': 'Y-27632'}, make_product('Y-27632', 'mce'), False)
+    assert not output_path.exists()
+    assert not checkpoint_path.exists()
+
+    writer.on_result({'product_name': 'Y-27632'}, None, True)
+    assert read_csv_names(output_path) == ['Y-27632']
+    record = json.loads(checkpoint_path.read_text(encoding='utf-8'))
+    assert (record['product_name'], record['products'], record['filtered_count']) == ('Y-27632', 1, 1)
+
+
+def test_checkpoint_ignores_truncated_line(tmp_path):
+    checkpoint_path = tmp_path / 'out.csv.checkpoint.jsonl'
+    checkpoint_path.write_text(json.dumps({'product_name': 'DMSO'}) + '\n{"product_na', encoding='utf-8')
+
+    assert reagent_engine.load_batch_checkpoint(str(checkpoint_path)) == {'DMSO'}
+
+
+def test_resume_skips_completed_products(tmp_path, batch_env):
+    output_path = str(tmp_path / 'out.csv')
+    assert reagent_engine.run_batch(['Y-27632'], output_path, logger=reagent_engine.ConsoleLogger()) == 1
+
+    # 中断後の再実行: 完了済みの製品は再処理せず、残りだけを同じCSVへ追記
+    processed = reagent_engine.run_batch(['Y-27632', 'DMSO'], output_path, logger=reagent_engine.ConsoleLogger())
+
+    assert processed == 1
+    assert batch_env.runs == [['Y-27632'], ['DMSO']]
+    assert read_csv_names(output_path) == ['Y-27632', 'Y-27632', 'DMSO', 'DMSO']
+    assert reagent_engine.run_batch(['Y-27632', 'DMSO'], output_path, logger=reagent_engine.ConsoleLogger()) == 0
+
+
+def test_no_resume_starts_over(tmp_path, batch_env):
+    output_path = str(tmp_path / 'out.csv')
+    reagent_engine.run_batch(['Y-27632'], output_path, logger=reagent_engine.ConsoleLogger())
+
+    processed = reagent_engine.run_batch(['Y-27632'], output_path, resume=False, logger=reagent_engine.ConsoleLogger())
+
+    assert processed == 1
+    assert batch_env.runs == [['Y-27632'], ['Y-27632']]
+    assert read_csv_names(output_path) == ['Y-27632', 'Y-27632']
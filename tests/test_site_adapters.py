@@ -0,0 +1,92 @@
+"""サイト別アダプタの検証
+
+fixtures/adapters/<site_key>.html は実サイトの保存ページではなく、h1・サイト固有の型番表記・
+製品自身の価格表・関連製品の価格表を含む合成ページ（価格表の位置・入れ子はサイトごとに変えている）。
+サイト固有の price_selectors を追加する場合は、実ページを保存してここにテストを追加する。
+"""
+from pathlib import Path
+
+import pytest
+
+import reagent_engine
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'adapters'
+
+EXPECTED = {
+    'cosmobio': ('Rapamycin', 'R-5000', 14800, 52000),
+    'funakoshi': ('Rapamycin', 'R-5000', 14800, 52000),
+    'selleck': ('Rapamycin (Sirolimus)', 'S1039', 14800, 52000),
+    'mce': ('Rapamycin', 'HY-10219', 120, 450),
+    'nakarai': ('ラパマイシン', '30950-54', 14800, 52000),
+    'fujifilm': ('Rapamycin', '553-00821', 14800, 52000),
+    'kanto': ('ラパマイシン', '32038-00', 14800, 52000),
+    'tci': ('Rapamycin', 'R0097', 14800, 52000),
+}
+
+
+def load_fixture(site_key):
+    return (FIXTURE_DIR / f'{site_key}.html').read_text(encoding='utf-8')
+
+
+def test_every_adapter_has_fixture():
+    assert set(reagent_engine.SITE_ADAPTERS) == set(EXPECTED)
+
+
+@pytest.mark.parametrize('site_key', sorted(EXPECTED))
+def test_adapter_extracts_product_table(site_key):
+    name, catalog_number, price_small, price_large = EXPECTED[site_key]
+    result = reagent_engine.run_site_adapter(site_key, load_fixture(site_key))
+
+    assert result['success']
+    info = result['product_info']
+    assert info['productName'] == name
+    assert info['modelNumber'] == catalog_number
+    assert info['manufacturer'] == reagent_engine.SITE_ADAPTERS[site_key].manufacturer
+    assert info['offers'] == [
+        {'size': '1mg', 'price': price_small, 'inStock': True},
+        {'size': '5mg', 'price': price_large, 'inStock': False},
+    ]
+
+
+@pytest.mark.parametrize('site_key', sorted(EXPECTED))
+def test_adapter_ignores_related_products(site_key):
+    html = load_fixture(site_key)
+    # 製品自身の価格表がなければ関連製品の価格表は採用せず失敗（Geminiに委ねる）
+    start = html.rindex('<table', 0, html.index('<td>1mg</td>'))
+    html_without_product_table = html[:start] + html[html.index('</table>', start) + len('</table>'):]
+    result = reagent_engine.run_site_adapter(site_key, html_without_product_table)
+
+    assert not result['success']
+    assert result['product_info']['offers'] == []
+    assert 'offers' in result['missing']
+
+
+def test_price_selectors_limit_offers_to_selected_table():
+    class SelectorAdapter(reagent_engine.SiteAdapter):
+        price_selectors = ['table.price']
+
+    html = ('<h1>Rapamycin</h1><table><tr><td>1mg</td><td>¥9,999</td></tr></table>'
+            '<table class="price"><tr><td>5mg</td><td>¥52,000</td></tr></table>')
+    adapter = SelectorAdapter()
+
+    assert adapter.ready_selector == 'table.price'
+    assert adapter.extract_offers(html) == [{'size': '5mg', 'price': 52000, 'inStock': True}]
+
+
+def test_kanto_catalog_pattern_rejects_words():
+    adapter = reagent_engine.SITE_ADAPTERS['kanto']
+    html = '<h1>ラパマイシン</h1><p>品番：standard グレード</p><p>CAS: 53123-88-9</p>'
+
+    # 任意の単語は製品番号として採用せず、CASにフォールバック
+    assert adapter.extract_catalog_number(html) == '53123-88-9'
+
+
+def test_select_first_handles_nesting_and_descendants():
+    html = ('<div id="outer"><div class="inner"><table class="t"><tr><td>a</td></tr></table></div>'
+            '<span>b</span></div><table class="t x"><tr><td>c</td></tr></table>')
+
+    assert reagent_engine.select_first(html, '#outer').endswith('<span>b</span></div>')
+    assert reagent_engine.select_first(html, 'div.inner table') == '<table class="t"><tr><td>a</td></tr></table>'
+    assert reagent_engine.select_first(html, 'table.x') == '<table class="t x"><tr><td>c</td></tr></table>'
+    assert reagent_engine.select_first(html, 'ul.missing, span') == '<span>b</span>'
+    assert reagent_engine.select_first(html, 'ul.missing') is None